@@ -1,7 +1,6 @@
 """Main entry point for the car rental agent."""
 
-import uvicorn
-from simple_executor import app
+from simple_executor import main
 
 if __name__ == "__main__":
     print("🚗 Starting Car Rental Agent (LangGraph + Groq Llama-3 70B)")
@@ -9,4 +8,4 @@ if __name__ == "__main__":
     print("🔗 Health check: http://localhost:10003/health")
     print("💬 Chat endpoint: http://localhost:10003/chat")
     print("=" * 60)
-    uvicorn.run(app, host="0.0.0.0", port=10003) 
\ No newline at end of file
+    main()
@@ -1,6 +1,8 @@
 """Agent executor for car rental agent."""
 
 import json
+import os
+import sys
 from typing import Any, Dict, List
 
 from a2a.types import (
@@ -15,6 +17,7 @@ from a2a.types import (
     TaskArtifactPart,
 )
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from .agent import CarRentalAgent
@@ -48,7 +51,7 @@ async def send_message(request: SendMessageRequest) -> SendMessageResponse:
             raise HTTPException(status_code=400, detail="No text content found in message")
         
         # Process the request using the car rental agent
-        response = car_rental_agent.invoke(user_text, str(request.id))
+        response = await run_in_threadpool(car_rental_agent.invoke, user_text, str(request.id))
         
         # Extract content from response
         if isinstance(response, dict) and 'content' in response:
@@ -102,6 +105,21 @@ async def health_check():
     return {"status": "healthy", "agent": "Car_Rental_Agent"}
 
 
-if __name__ == "__main__":
+def main():
+    """Serve the A2A endpoint; run from car_rental_agent_langgraph as `python -m app.agent_executor`."""
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=10003) 
\ No newline at end of file
+
+    # Workers load the app from the same package path the module was started under
+    uvicorn.run(
+        "app.agent_executor:app",
+        host="0.0.0.0",
+        port=10003,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
+
+
+if __name__ == "__main__":
+    main()
+ 
\ No newline at end of file
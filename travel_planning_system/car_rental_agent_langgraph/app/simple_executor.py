@@ -1,6 +1,10 @@
 """Simplified agent executor for car rental agent (without A2A dependencies)."""
 
+import os
+import sys
+
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 import uvicorn
 from dotenv import load_dotenv
@@ -28,7 +32,7 @@ async def chat(request: SimpleMessageRequest):
         message = request.message
         if request.car_type and request.car_type != "any":
             message += f" with car type {request.car_type}"
-        response = car_rental_agent.invoke(message, "test_context")
+        response = await run_in_threadpool(car_rental_agent.invoke, message, "test_context")
         # Ensure response is serializable (dict/list/str)
         if hasattr(response, 'model_dump'):
             response = response.model_dump()
@@ -58,5 +62,18 @@ async def root():
     }
 
 
+def main():
+    """Start the car rental server on port 10003."""
+    # Passed by import path so uvicorn can spawn workers, each with its own CarRentalAgent
+    uvicorn.run(
+        "simple_executor:app",
+        host="0.0.0.0",
+        port=10003,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=10003) 
\ No newline at end of file
+    main()
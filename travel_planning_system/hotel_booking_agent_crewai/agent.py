@@ -1,17 +1,177 @@
+import asyncio
+import functools
+import hashlib
 import os
-import json
-import requests
-from datetime import date
-from typing import Type
+import queue
+import re
+import threading
+from datetime import date, timedelta
+from typing import AsyncIterable, Type
 
+import httpx
+import orjson
+from cachetools import TTLCache
 from crewai import LLM, Agent, Crew, Process, Task,LLM
 from crewai.tools import BaseTool
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from langchain_groq import ChatGroq
 
 load_dotenv()
 
+# Pooled keep-alive client for Serper so searches skip the TCP + TLS handshake
+_SERPER_CLIENT = httpx.Client(
+    http2=True,
+    timeout=10.0,
+    limits=httpx.Limits(max_keepalive_connections=32),
+    headers={"Content-Type": "application/json"},
+)
+
+# Matches a USD price such as "$120" or "$1,200" in a search snippet
+_PRICE_RE = re.compile(r"\$([0-9]+[,.]?[0-9]*)")
+
+# Patterns used to pull search slots out of a free-text hotel query
+_ISO_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
+_NIGHTS_RE = re.compile(r"\b(\d+)\s+nights?\b", re.IGNORECASE)
+# Destinations recognised in any casing; multi-word names are tried before their prefixes
+_KNOWN_CITIES = (
+    "Amsterdam", "Athens", "Bangkok", "Barcelona", "Berlin", "Boston", "Budapest",
+    "Buenos Aires", "Cape Town", "Chicago", "Copenhagen", "Delhi", "Dubai", "Dublin",
+    "Edinburgh", "Florence", "Hong Kong", "Istanbul", "Kyoto", "Las Vegas", "Lisbon",
+    "London", "Los Angeles", "Madrid", "Melbourne", "Mexico City", "Miami", "Milan",
+    "Mumbai", "Munich", "New Delhi", "New York", "Osaka", "Paris", "Prague",
+    "Rio de Janeiro", "Rome", "San Francisco", "Seoul", "Singapore", "Sydney",
+    "Tokyo", "Toronto", "Vancouver", "Venice", "Vienna",
+)
+_CITY_NAMES = {city.lower(): city for city in _KNOWN_CITIES}
+_CITY_PATTERN = "|".join(re.escape(city) for city in sorted(_KNOWN_CITIES, key=len, reverse=True))
+_KNOWN_CITY_RE = re.compile(rf"\b({_CITY_PATTERN})\b", re.IGNORECASE)
+_KNOWN_CITY_AFTER_PREPOSITION_RE = re.compile(
+    rf"\b(?:in|to|at|near)\s+({_CITY_PATTERN})\b", re.IGNORECASE
+)
+# Capitalized words that follow a preposition but are not places
+_NOT_A_PLACE = (
+    "January|February|March|April|May|June|July|August|September|October|November|December|"
+    "Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday|"
+    "In|To|At|Near|From|For|On|Next|This|With|And"
+)
+_PLACE_WORD = rf"(?!(?:{_NOT_A_PLACE})\b)[A-Z][\w'-]*"
+_LOCATION_RE = re.compile(rf"\b(?i:in|to|at|near)\s+({_PLACE_WORD}(?:\s+{_PLACE_WORD})*)")
+_BUDGET_RE = re.compile(r"\b(budget|cheap|affordable|mid-range|luxury)\b", re.IGNORECASE)
+_BUDGET_ALIASES = {"cheap": "budget", "affordable": "budget"}
+_BOOKING_INTENT_RE = re.compile(r"\b(?:book|reserv)\w*", re.IGNORECASE)
+
+# Pre-built crews per agent, sized like ThreadPoolExecutor's default; extra kickoffs wait for a free crew
+CREW_POOL_SIZE = int(os.getenv("CREW_POOL_SIZE", min(32, (os.cpu_count() or 1) + 4)))
+
+# Groq JSON mode, guarantees the summary parses without retries
+JSON_MODE = {"type": "json_object"}
+
+# Output format shared by the crew task and the single-pass summary. JSON mode
+# only allows a top-level object, so the hotel list sits under "hotels".
+HOTEL_LIST_FORMAT = """
+                {
+                    "hotels": [
+                        {
+                            "name": "Name of the  hotel",
+                            "description": "A description of the hotel in no more than 40 words",
+                            "link": "https://...(URL)",
+                            "estimated_cost_usd": "$10"
+                        }
+                    ]
+                }
+            """
+
+# Identical hotel searches are served from memory for 15 minutes
+_SEARCH_CACHE = TTLCache(maxsize=4096, ttl=900)
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+
+def _search_cache_key(location: str, check_in: str, check_out: str, budget: str) -> str:
+    """Builds the cache key for a hotel search."""
+    raw_key = f"{location.strip().lower()}|{check_in}|{check_out}|{budget.strip().lower()}"
+    return hashlib.sha1(raw_key.encode("utf-8")).hexdigest()
+
+
+def _extract_location(query: str) -> str | None:
+    """Finds the destination, preferring known cities over any capitalized phrase."""
+    for pattern in (_KNOWN_CITY_AFTER_PREPOSITION_RE, _LOCATION_RE, _KNOWN_CITY_RE):
+        match = pattern.search(query)
+        if match:
+            return _CITY_NAMES.get(match.group(1).lower(), match.group(1))
+    return None
+
+
+def extract_slots(query: str) -> dict:
+    """Extracts location, dates and budget from a hotel query without calling the LLM.
+
+    Slots that cannot be found in the query, or dates that don't form a valid stay,
+    are returned as None.
+    """
+    today = date.today()
+    lowered = query.lower()
+
+    dates = []
+    invalid_date = False
+    for raw_date in _ISO_DATE_RE.findall(query):
+        try:
+            dates.append(date.fromisoformat(raw_date))
+        except ValueError:
+            invalid_date = True
+    check_in = dates[0] if dates else None
+    check_out = dates[1] if len(dates) > 1 else None
+
+    if check_in is None:
+        if "next week" in lowered:
+            check_in = today + timedelta(days=7 - today.weekday())
+            check_out = check_out or check_in + timedelta(days=7)
+        elif "tomorrow" in lowered:
+            check_in = today + timedelta(days=1)
+        elif "tonight" in lowered or "today" in lowered:
+            check_in = today
+
+    nights_match = _NIGHTS_RE.search(query)
+    if check_in and nights_match and (check_out is None or not dates):
+        check_out = check_in + timedelta(days=int(nights_match.group(1)))
+
+    # Impossible, reversed or zero-night stays are left for the crew to clarify
+    if invalid_date or (check_in and check_out and check_out <= check_in):
+        check_in = check_out = None
+
+    budget_match = _BUDGET_RE.search(query)
+    budget = budget_match.group(1).lower() if budget_match else None
+
+    return {
+        "location": _extract_location(query),
+        "check_in": check_in.isoformat() if check_in else None,
+        "check_out": check_out.isoformat() if check_out else None,
+        "budget": _BUDGET_ALIASES.get(budget, budget),
+    }
+
+
+def is_simple_search(question: str, slots: dict) -> bool:
+    """Whether a query is a plain search with every argument known, so the crew can be skipped."""
+    return bool(
+        slots["location"]
+        and slots["check_in"]
+        and slots["check_out"]
+        and not _BOOKING_INTENT_RE.search(question)
+    )
+
+
+class HotelRecommendation(BaseModel):
+    """A single hotel in the agent's recommendation list."""
+
+    name: str
+    description: str
+    link: str
+    estimated_cost_usd: str
+
+
+class HotelRecommendations(BaseModel):
+    """The agent's hotel recommendation list."""
+
+    hotels: list[HotelRecommendation]
+
 
 class HotelSearchToolInput(BaseModel):
     """Input schema for HotelSearchTool."""
@@ -48,6 +208,12 @@ class HotelSearchTool(BaseTool):
         if not serper_api_key:
             return "SERPER_API_KEY not found in environment variables"
         
+        cache_key = _search_cache_key(location, check_in, check_out, budget)
+        with _SEARCH_CACHE_LOCK:
+            cached = _SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Bias search toward MakeMyTrip, Goibibo, Booking.com
         search_query = (
             f"Budget friendly hotels in {location} from {check_in} to {check_out}"
@@ -56,43 +222,38 @@ class HotelSearchTool(BaseTool):
             search_query += f" {budget} hotels"
         
         url = "https://google.serper.dev/search"
-        headers = {
-            "X-API-KEY": serper_api_key,
-            "Content-Type": "application/json"
-        }
+        headers = {"X-API-KEY": serper_api_key}
         payload = {
             "q": search_query,
-            "num": 10
+            "num": 5
         }
         
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = _SERPER_CLIENT.post(url, headers=headers, json=payload)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Extract hotel information
             results = []
             if "organic" in data:
-                for result in data["organic"][:5]:
+                for result in data["organic"]:
                     # Try to extract price in USD from snippet if possible
                     price_usd = None
                     snippet = result.get("snippet", "")
-                    import re
-                    price_match = re.search(r"\$([0-9]+[,.]?[0-9]*)", snippet)
+                    price_match = _PRICE_RE.search(snippet)
                     if price_match:
                         price_usd = f"${price_match.group(1)} USD"
                     results.append({
                         "name": result.get("title", ""),
                         "description": snippet,
                         "link": result.get("link", ""),
-                        "location": location,
-                        "check_in": check_in,
-                        "check_out": check_out,
-                        "budget": budget,
                         "estimated_cost_usd": price_usd if price_usd else "N/A"
                     })
             
-            return json.dumps(results, indent=2)
+            results_json = orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+            with _SEARCH_CACHE_LOCK:
+                _SEARCH_CACHE[cache_key] = results_json
+            return results_json
         except Exception as e:
             return f"Error searching for hotels: {str(e)}"
 
@@ -129,7 +290,9 @@ class HotelBookingTool(BaseTool):
     def _run(self, hotel_name: str, check_in: str, check_out: str, guests: int = 1) -> str:
         """Simulate hotel booking process."""
         # In a real implementation, this would integrate with hotel booking APIs
-        booking_id = f"HB{date.today().strftime('%Y%m%d')}{hash(hotel_name) % 10000:04d}"
+        # blake2b keeps the suffix stable across restarts, unlike the per-process seeded hash()
+        hotel_digest = hashlib.blake2b(hotel_name.encode("utf-8"), digest_size=3).hexdigest()
+        booking_id = f"HB{date.today().strftime('%Y%m%d')}{hotel_digest}"
         
         booking = {
             "booking_id": booking_id,
@@ -141,7 +304,12 @@ class HotelBookingTool(BaseTool):
             "booking_date": date.today().isoformat()
         }
         
-        return json.dumps(booking, indent=2)
+        return orjson.dumps(booking, option=orjson.OPT_INDENT_2).decode()
+
+
+# Tools are stateless, so one instance of each is shared by every agent in the process
+SEARCH_TOOL = HotelSearchTool()
+BOOKING_TOOL = HotelBookingTool()
 
 
 class HotelBookingAgent:
@@ -156,12 +324,32 @@ class HotelBookingAgent:
         if os.getenv("GROQ_API_KEY"):
             self.llm = LLM(
                             model="groq/llama-3.3-70b-versatile",
-                            api_key=os.getenv("GROQ_API_KEY")
+                            api_key=os.getenv("GROQ_API_KEY"),
+                        )
+            # The crew's ReAct loop needs free-form text, so only the summary models use JSON mode
+            self.summary_llm = LLM(
+                            model="groq/llama-3.3-70b-versatile",
+                            api_key=os.getenv("GROQ_API_KEY"),
+                            response_format=JSON_MODE,
+                        )
+            # Smaller model from the same family drafts summaries before escalating to 70B
+            self.draft_llm = LLM(
+                            model="groq/llama-3.1-8b-instant",
+                            api_key=os.getenv("GROQ_API_KEY"),
+                            response_format=JSON_MODE,
                         )
         else:
             raise ValueError("GROQ_API_KEY environment variable not set.")
 
-        self.hotel_booking_assistant = Agent(
+        # Crews keep per-run state on their agent and task, so concurrent kickoffs each
+        # check out their own pre-built crew instead of sharing or rebuilding one
+        self._crews: queue.Queue = queue.Queue()
+        for _ in range(CREW_POOL_SIZE):
+            self._crews.put(self._build_crew())
+
+    def _build_crew(self) -> Crew:
+        """Builds a hotel booking crew whose task fills in {question} and {today} at kickoff."""
+        hotel_booking_assistant = Agent(
             role="Hotel Booking Specialist",
             goal="Find and book the best hotels for travelers based on their preferences and requirements.",
             backstory=(
@@ -173,41 +361,105 @@ class HotelBookingAgent:
             ),
             verbose=True,
             allow_delegation=False,
-            tools=[HotelSearchTool(), HotelBookingTool()],
+            tools=[SEARCH_TOOL, BOOKING_TOOL],
             llm=self.llm,
         )
-
-    def invoke(self, question: str) -> str:
-        """Kicks off the crew to answer a hotel booking question."""
-        task_description = (
-            f"Help the user with their hotel booking request. The user asked: '{question}'. "
-            f"Today's date is {date.today().strftime('%Y-%m-%d')}. "
-            f"First search for available hotels, then provide booking options or make a booking if requested."
-        )
-
-        hotel_booking_task = Task(
-            description=task_description,
-            expected_output="""
-                    [
-                    {
-                        "name": "Name of the  hotel",
-                        "description": "A description of the hotel in no more than 40 words",
-                        "link": "https://...(URL)",
-                        "estimated_cost_usd": "$10"
-                    },
-                    ...
-                ]
-            """,
-            agent=self.hotel_booking_assistant,
+        task = Task(
+            description=(
+                "Help the user with their hotel booking request. The user asked: '{question}'. "
+                "Today's date is {today}. "
+                "First search for available hotels, then provide booking options or make a booking if requested."
+            ),
+            expected_output=HOTEL_LIST_FORMAT,
+            agent=hotel_booking_assistant,
         )
-
-        crew = Crew(
-            agents=[self.hotel_booking_assistant],
-            tasks=[hotel_booking_task],
+        return Crew(
+            agents=[hotel_booking_assistant],
+            tasks=[task],
             process=Process.sequential,
             verbose=True,
         )
-        result = crew.kickoff()
+
+    def _kickoff(self, question: str, step_callback=None):
+        """Runs a pooled crew for a single hotel booking question."""
+        crew = self._crews.get()
+        try:
+            # Set on the agent too: the crew only hands its callback to agents that have none
+            crew.step_callback = step_callback
+            for agent in crew.agents:
+                agent.step_callback = step_callback
+            return crew.kickoff(
+                inputs={"question": question, "today": date.today().isoformat()}
+            )
+        finally:
+            self._crews.put(crew)
+
+    def _answer_directly(self, question: str, slots: dict) -> str:
+        """Answers a plain hotel search with one search and one LLM call, skipping the crew."""
+        search_results = SEARCH_TOOL._run(
+            location=slots["location"],
+            check_in=slots["check_in"],
+            check_out=slots["check_out"],
+            budget=slots["budget"] or "any",
+        )
+        summarize_prompt = (
+            f"You are a hotel booking specialist. The user asked: '{question}'.\n"
+            f"Here are the hotel search results:\n{search_results}\n"
+            f"Recommend the best hotels from these results. Respond only with a JSON object in this format:\n"
+            f"{HOTEL_LIST_FORMAT}"
+        )
+        try:
+            draft = self.draft_llm.call(summarize_prompt)
+            HotelRecommendations.model_validate_json(draft)
+            return draft
+        except Exception:
+            # Covers drafts that don't match the schema and Groq's json_validate_failed
+            # 400s, which the LLM raises instead of returning
+            return self.summary_llm.call(summarize_prompt)
+
+    def invoke(self, question: str) -> str:
+        """Kicks off the crew to answer a hotel booking question."""
+        slots = extract_slots(question)
+        if is_simple_search(question, slots):
+            # Every search argument is known up front, so the agent loop adds nothing
+            response = self._answer_directly(question, slots)
+            print(f"Hotel response DIRECT: {response}")
+            return response
+
+        result = self._kickoff(question)
         print(f"Hotel response CREWAI: {result.raw}")
         # response ={"hotel_response":result.raw}
-        return result.raw
\ No newline at end of file
+        return result.raw
+
+    async def stream(self, question: str) -> AsyncIterable[str]:
+        """Kicks off the crew and yields each agent step as soon as it completes.
+
+        Streaming is per step, not per token: each chunk is a whole thought, tool call
+        or final answer.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def on_step(step):
+            # AgentFinish carries the final answer in `output`, AgentAction in `text`
+            chunk = getattr(step, "output", None) or getattr(step, "text", "")
+            if chunk:
+                loop.call_soon_threadsafe(queue.put_nowait, str(chunk))
+
+        def run_crew():
+            try:
+                return self._kickoff(question, step_callback=on_step)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        kickoff = loop.run_in_executor(None, run_crew)
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+        result = await kickoff
+        print(f"Hotel response CREWAI: {result.raw}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_hotel_agent() -> HotelBookingAgent:
+    """Returns the process-wide HotelBookingAgent, building it on first use."""
+    return HotelBookingAgent()
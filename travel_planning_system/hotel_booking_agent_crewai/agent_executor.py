@@ -1,6 +1,8 @@
 """Agent executor for hotel booking agent."""
 
 import json
+import os
+import sys
 from typing import Any, Dict, List
 
 from a2a.types import (
@@ -15,14 +17,18 @@ from a2a.types import (
     TaskArtifactPart,
 )
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
-from .agent import HotelBookingAgent
+from .agent import get_hotel_agent
 
 app = FastAPI(title="Hotel Booking Agent", version="1.0.0")
 
-# Initialize the hotel booking agent
-hotel_booking_agent = HotelBookingAgent()
+
+@app.on_event("startup")
+async def warm_up_agent():
+    """Build the hotel agent off the event loop before the first request arrives."""
+    await run_in_threadpool(get_hotel_agent)
 
 
 class MessageRequest(BaseModel):
@@ -48,7 +54,7 @@ async def send_message(request: SendMessageRequest) -> SendMessageResponse:
             raise HTTPException(status_code=400, detail="No text content found in message")
         
         # Process the request using the hotel booking agent
-        response_text = hotel_booking_agent.invoke(user_text)
+        response_text = await run_in_threadpool(get_hotel_agent().invoke, user_text)
         
         # Create response artifacts
         artifact_part = TaskArtifactPart(
@@ -90,6 +96,21 @@ async def get_agent_card() -> AgentCard:
     )
 
 
-if __name__ == "__main__":
+def main():
+    """Serve the A2A endpoint; run as `python -m hotel_booking_agent_crewai.agent_executor`."""
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=10002) 
\ No newline at end of file
+
+    # The relative import needs the package path, which the workers reuse to load the app
+    uvicorn.run(
+        "hotel_booking_agent_crewai.agent_executor:app",
+        host="0.0.0.0",
+        port=10002,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
+
+
+if __name__ == "__main__":
+    main()
+ 
\ No newline at end of file
@@ -1,15 +1,23 @@
 """Simplified agent executor for hotel booking agent (without A2A dependencies)."""
 
+import os
+import sys
+
 from fastapi import FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 
-from agent import HotelBookingAgent
+from agent import get_hotel_agent
 
 app = FastAPI(title="Hotel Booking Agent", version="1.0.0")
 
-# Initialize the hotel booking agent
-hotel_booking_agent = HotelBookingAgent()
+
+@app.on_event("startup")
+async def warm_up_agent():
+    """Build the hotel agent off the event loop before the first request arrives."""
+    await run_in_threadpool(get_hotel_agent)
 
 
 class SimpleMessageRequest(BaseModel):
@@ -21,12 +29,31 @@ class SimpleMessageRequest(BaseModel):
 async def chat(request: SimpleMessageRequest):
     """Simple chat endpoint for testing."""
     try:
-        response = hotel_booking_agent.invoke(request.message)
+        response = await run_in_threadpool(get_hotel_agent().invoke, request.message)
         return {"response": response}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+def _sse(chunk: str) -> str:
+    """Frame a text chunk as a Server-Sent Event."""
+    return "".join(f"data: {line}\n" for line in chunk.split("\n")) + "\n"
+
+
+@app.post("/chat/stream")
+async def chat_stream(request: SimpleMessageRequest):
+    """Chat endpoint that streams each completed agent step (not tokens) as Server-Sent Events."""
+
+    async def events():
+        try:
+            async for chunk in get_hotel_agent().stream(request.message):
+                yield _sse(chunk)
+        except Exception as e:
+            yield _sse(f"Error: {str(e)}")
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -41,10 +68,24 @@ async def root():
         "description": "Hotel booking agent using CrewAI + Groq Llama-3 70B",
         "endpoints": {
             "chat": "/chat",
+            "chat_stream": "/chat/stream",
             "health": "/health"
         }
     }
 
 
+def main():
+    """Run the hotel booking server with WEB_CONCURRENCY workers (default: one per CPU)."""
+    # uvicorn only forks workers from an import string; each worker warms up its own agent
+    uvicorn.run(
+        "simple_executor:app",
+        host="0.0.0.0",
+        port=10002,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
+
+
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=10002) 
\ No newline at end of file
+    main()
@@ -4,12 +4,42 @@ Simplified Hotel Booking Agent without CrewAI.
 This version directly uses the tools and LLM for better compatibility.
 """
 
+import asyncio
+import functools
 import os
 import json
-from datetime import date
+from datetime import date, timedelta
 from dotenv import load_dotenv
-from langchain_groq import ChatGroq
-from agent import HotelSearchTool, HotelBookingTool
+import orjson
+from groq import AsyncGroq
+from agent import BOOKING_TOOL, JSON_MODE, SEARCH_TOOL, extract_slots
+
+# Fixed instructions sent as the system message so only the query and hotels vary per request
+SYSTEM_PROMPT = (
+    "You are a hotel booking specialist. The user message holds the traveler's request and "
+    "hotel search results as JSON records: n=name, d=description, u=link, p=estimated price. "
+    "Recommend up to 5 budget-friendly hotels, only ones listed in the results, covering price, amenities, "
+    "ratings and location in each description. Respond only with a JSON object: "
+    '{"hotels": [{"name": str, "description": str (max 40 words), "link": str, "estimated_cost_usd": str}]}'
+)
+
+def _compact_hotels(search_results):
+    """Shrink search tool output to short-keyed hotel records for the prompt."""
+    try:
+        hotels = orjson.loads(search_results)
+    except orjson.JSONDecodeError:
+        # Tool errors come back as plain text, pass them through unchanged
+        return search_results
+    
+    return orjson.dumps([
+        {
+            "n": hotel.get("name", ""),
+            "d": hotel.get("description", "")[:80],
+            "u": hotel.get("link", ""),
+            "p": hotel.get("estimated_cost_usd", "N/A"),
+        }
+        for hotel in hotels
+    ]).decode()
 
 class SimpleHotelAgent:
     """Simplified hotel booking agent without CrewAI."""
@@ -22,10 +52,22 @@ class SimpleHotelAgent:
         if not groq_key:
             raise ValueError("GROQ_API_KEY not found")
         
-        self.llm = ChatGroq(model="llama3-70b-8192", api_key=groq_key)
-        self.search_tool = HotelSearchTool()
-        self.booking_tool = HotelBookingTool()
+        self.groq_key = groq_key
+        # The async client's connection pool is bound to the loop it first runs on
+        self._client = None
+        self._client_loop = None
+        self.search_tool = SEARCH_TOOL
+        self.booking_tool = BOOKING_TOOL
         
+    @property
+    def client(self):
+        """Native Groq client for the running event loop, reused across its queries."""
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            self._client = AsyncGroq(api_key=self.groq_key)
+            self._client_loop = loop
+        return self._client
+    
     def search_hotels(self, location, check_in, check_out, budget="budget"):
         """Search for hotels using the search tool."""
         try:
@@ -52,41 +94,57 @@ class SimpleHotelAgent:
         except Exception as e:
             return f"Error booking hotel: {e}"
     
-    def process_query(self, query):
-        """Process a hotel booking query."""
+    async def process_query(self, query):
+        """Process a hotel booking query, yielding the LLM's JSON response."""
         print(f"🔍 Processing query: {query}")
         
+        # Pull the search arguments out of the query, falling back to a week in Paris
+        slots = extract_slots(query)
+        check_in = slots["check_in"] or (date.today() + timedelta(days=7)).isoformat()
+        check_out = slots["check_out"] or (
+            date.fromisoformat(check_in) + timedelta(days=7)
+        ).isoformat()
+        
         # First, search for hotels
-        search_results = self.search_hotels(
-            location="Paris",  # Default location, can be extracted from query
-            check_in="2024-07-15",  # Default dates, can be extracted from query
-            check_out="2024-07-22",
-            budget="budget"
+        search_results = await asyncio.to_thread(
+            self.search_hotels,
+            location=slots["location"] or "Paris",
+            check_in=check_in,
+            check_out=check_out,
+            budget=slots["budget"] or "budget"
         )
         
-        # Create a prompt for the LLM to analyze the results
-        prompt = f"""
-        You are a hotel booking specialist. The user asked: "{query}"
-        
-        Here are the hotel search results:
-        {search_results}
-        
-        Please provide a comprehensive response with:
-        1. Top 10 budget-friendly hotel recommendations
-        2. Price ranges and amenities
-        3. Guest ratings and reviews
-        4. Location details
-        5. Booking recommendations
-        
-        Format your response clearly with bullet points and sections.
-        """
+        messages = [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": f"Request: {query}\nHotels: {_compact_hotels(search_results)}"},
+        ]
         
         try:
-            # Get LLM response
-            response = self.llm.invoke(prompt)
-            return response.content
+            # JSON mode can't stream, so the whole parseable response comes back as one chunk
+            response = await self.client.chat.completions.create(
+                model="llama-3.3-70b-versatile",
+                messages=messages,
+                response_format=JSON_MODE,
+            )
+            yield response.choices[0].message.content
         except Exception as e:
-            return f"Error processing with LLM: {e}"
+            yield f"Error processing with LLM: {e}"
+
+@functools.lru_cache(maxsize=1)
+def get_simple_hotel_agent():
+    """Return the process-wide SimpleHotelAgent, building it on first use."""
+    return SimpleHotelAgent()
+
+async def _collect_response(agent, query):
+    """Join a query response into a single string."""
+    return "".join([chunk async for chunk in agent.process_query(query)])
+
+async def _run_queries(agent, queries):
+    """Run all queries concurrently, returning responses (or errors) in order."""
+    return await asyncio.gather(
+        *(_collect_response(agent, query) for query in queries),
+        return_exceptions=True,
+    )
 
 def test_simple_agent():
     """Test the simple hotel agent."""
@@ -94,28 +152,28 @@ def test_simple_agent():
     print("=" * 50)
     
     try:
-        agent = SimpleHotelAgent()
+        agent = get_simple_hotel_agent()
         print("✅ Agent initialized successfully!")
         
         # Test queries
         test_queries = [
-            "Find top 10 budget-friendly hotels in Paris for next week",
+            "Find top 5 budget-friendly hotels in Paris for next week",
             "Search for cheap hotels in Tokyo under $100 per night",
             "What are the best budget hotels in New York City?"
         ]
         
-        for i, query in enumerate(test_queries, 1):
+        responses = asyncio.run(_run_queries(agent, test_queries))
+        
+        for i, (query, response) in enumerate(zip(test_queries, responses), 1):
             print(f"\n🧪 Test {i}: {query}")
             print("-" * 60)
             
-            try:
-                response = agent.process_query(query)
+            if isinstance(response, Exception):
+                print(f"❌ Error: {str(response)}")
+            else:
                 print(f"✅ Response:")
                 print(response)
                 print("\n" + "="*60)
-                
-            except Exception as e:
-                print(f"❌ Error: {str(e)}")
         
         print("\n🎉 Simple agent tests completed!")
         
@@ -104,11 +104,14 @@ def test_groq_connection():
         return False
     
     try:
-        from langchain_groq import ChatGroq
+        from groq import Groq
         
-        llm = ChatGroq(model="llama3-70b-8192", api_key=groq_key)
-        response = llm.invoke("Hello! Please respond with 'Groq working'.")
-        print(f"✅ Groq Response: {response.content}")
+        client = Groq(api_key=groq_key)
+        response = client.chat.completions.create(
+            model="llama-3.3-70b-versatile",
+            messages=[{"role": "user", "content": "Hello! Please respond with 'Groq working'."}],
+        )
+        print(f"✅ Groq Response: {response.choices[0].message.content}")
         return True
         
     except Exception as e:
@@ -70,8 +70,8 @@ def install_dependencies(agent_path, agent_name, dependencies):
     """Install dependencies for a specific agent."""
     print(f"📦 Installing dependencies for {agent_name}...")
     
-    # Install dependencies using UV
-    deps_str = " ".join(dependencies)
+    # Install dependencies using UV, quoted so extras and environment markers reach uv intact
+    deps_str = " ".join(f'"{dependency}"' for dependency in dependencies)
     command = f"uv pip install {deps_str}"
     
     result = run_command(command, cwd=agent_path)
@@ -105,6 +105,8 @@ def main():
                 "serper-python",
                 "fastapi",
                 "uvicorn",
+                "uvloop; sys_platform != 'win32'",
+                "httptools",
                 "httpx",
                 "nest-asyncio"
             ]
@@ -112,13 +114,17 @@ def main():
         "hotel_booking_agent_crewai": {
             "dependencies": [
                 "groq",
-                "langchain_groq",
                 "crewai>=0.70.0",
                 "python-dotenv",
                 "requests",
+                "httpx[http2]",
+                "cachetools",
+                "orjson",
                 "serper-python",
                 "fastapi",
                 "uvicorn",
+                "uvloop; sys_platform != 'win32'",
+                "httptools",
                 "pydantic"
             ]
         },
@@ -133,6 +139,8 @@ def main():
                 "serper-python",
                 "fastapi",
                 "uvicorn",
+                "uvloop; sys_platform != 'win32'",
+                "httptools",
                 "pydantic"
             ]
         }
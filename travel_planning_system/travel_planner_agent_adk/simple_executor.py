@@ -3,7 +3,12 @@
 Simple executor for the travel planner agent.
 """
 
+import asyncio
+import os
+import sys
+
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 import uvicorn
 from simple_travel_planner import SimpleTravelPlanner
@@ -13,22 +18,98 @@ app = FastAPI(title="Travel Planner Agent", version="1.0.0")
 # Initialize the travel planner
 travel_planner = SimpleTravelPlanner()
 
+# /plan requests are batched into a single LLM call. Larger batches
+# save Groq round-trips but every request in a batch waits for the longest plan,
+# and all of them share the model's 8k context window.
+MAX_BATCH = int(os.getenv("PLAN_MAX_BATCH", "3"))
+MAX_WAIT_MS = int(os.getenv("PLAN_MAX_WAIT_MS", "25"))
+
+plan_queue: asyncio.Queue = asyncio.Queue()
+# Keeps in-flight batch tasks referenced until they finish
+_batch_tasks = set()
+
 
 class TravelRequest(BaseModel):
     """Request model for travel planning."""
     message: str
 
 
+async def _run_batch(batch):
+    """Plan a batch of trips with one LLM call and resolve each waiting request."""
+    try:
+        plans = await travel_planner.plan_trips([message for message, _ in batch])
+    except Exception as e:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        return
+    for (_, future), plan in zip(batch, plans):
+        if not future.done():
+            future.set_result(plan)
+
+
+async def batcher():
+    """Drain queued /plan requests into batches of up to MAX_BATCH."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await plan_queue.get()]
+        deadline = loop.time() + MAX_WAIT_MS / 1000
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(plan_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        task = asyncio.create_task(_run_batch(batch))
+        _batch_tasks.add(task)
+        task.add_done_callback(_batch_tasks.discard)
+
+
+@app.on_event("startup")
+async def start_batcher():
+    """Start the background task that batches /plan requests."""
+    task = asyncio.create_task(batcher())
+    _batch_tasks.add(task)
+
+
+@app.on_event("shutdown")
+async def close_planner():
+    """Close the travel planner's pooled HTTP client."""
+    await travel_planner.aclose()
+
+
+def _sse(chunk: str) -> str:
+    """Frame a text chunk as a Server-Sent Event."""
+    return "".join(f"data: {line}\n" for line in chunk.split("\n")) + "\n"
+
+
 @app.post("/plan")
 async def plan_trip(request: TravelRequest):
     """Plan a trip by coordinating with other agents."""
     try:
-        plan = travel_planner.plan_trip(request.message)
-        return {"plan": plan}
+        future = asyncio.get_running_loop().create_future()
+        await plan_queue.put((request.message, future))
+        return {"plan": await future}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error: {str(e)}")
 
 
+@app.post("/plan/stream")
+async def plan_trip_stream(request: TravelRequest):
+    """Plan a trip by coordinating with other agents, streaming the plan as Server-Sent Events."""
+
+    async def events():
+        try:
+            async for chunk in travel_planner.plan_trip_stream(request.message):
+                yield _sse(chunk)
+        except Exception as e:
+            yield _sse(f"Error: {str(e)}")
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -38,7 +119,7 @@ async def health_check():
 @app.get("/agents/status")
 async def check_agents():
     """Check status of other agents."""
-    status = travel_planner.check_agent_status()
+    status = await travel_planner.check_agent_status()
     return {"agents": status}
 
 
@@ -50,6 +131,7 @@ async def root():
         "description": "Travel planning agent that coordinates with hotel and car rental agents",
         "endpoints": {
             "plan": "/plan",
+            "plan_stream": "/plan/stream",
             "health": "/health",
             "agents_status": "/agents/status"
         },
@@ -60,10 +142,23 @@ async def root():
     }
 
 
+def main():
+    """Start the travel planner server on port 10001."""
+    # Each worker imports the app itself, so it gets its own planner, batcher and client pool
+    uvicorn.run(
+        "simple_executor:app",
+        host="0.0.0.0",
+        port=10001,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
+
+
 if __name__ == "__main__":
     print("✈️ Starting Travel Planner Agent")
     print("📍 Server will be available at: http://localhost:10001")
     print("🔗 Health check: http://localhost:10001/health")
     print("📋 Plan endpoint: http://localhost:10001/plan")
     print("=" * 60)
-    uvicorn.run(app, host="0.0.0.0", port=10001) 
\ No newline at end of file
+    main()
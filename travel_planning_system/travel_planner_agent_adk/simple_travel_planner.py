@@ -4,13 +4,25 @@ Simplified Travel Planner Agent without A2A dependencies.
 This version directly communicates with the hotel and car rental agents via HTTP.
 """
 
+import asyncio
 import os
 import json
-import requests
+import httpx
 from datetime import datetime
 from dotenv import load_dotenv
 from langchain_groq import ChatGroq
 
+# Separates the individual plans when several requests share one LLM call
+PLAN_DELIMITER = "=====END OF PLAN====="
+# llama3-70b-8192 context window, and the room reserved for each generated plan
+CONTEXT_TOKENS = 8192
+PLAN_OUTPUT_TOKENS = 1500
+
+
+def _estimate_tokens(text):
+    """Rough token count, about four characters per token."""
+    return len(text) // 4 + 1
+
 class SimpleTravelPlanner:
     """Simplified travel planner that coordinates with other agents."""
     
@@ -28,43 +40,47 @@ class SimpleTravelPlanner:
         self.hotel_agent_url = "http://localhost:10002"
         self.car_rental_agent_url = "http://localhost:10003"
         
-    def check_agent_status(self):
+        # Shared client so connections to the agents are pooled across requests
+        self.client = httpx.AsyncClient(timeout=30)
+        
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self.client.aclose()
+        
+    async def check_agent_status(self):
         """Check if the other agents are running."""
         print("🔍 Checking agent status...")
         
-        agents_status = {}
+        agents = {
+            "hotel": self.hotel_agent_url,
+            "car_rental": self.car_rental_agent_url,
+        }
         
-        # Check hotel agent
-        try:
-            response = requests.get(f"{self.hotel_agent_url}/health", timeout=5)
-            if response.status_code == 200:
-                agents_status["hotel"] = "✅ Running"
-            else:
-                agents_status["hotel"] = "❌ Not responding"
-        except:
-            agents_status["hotel"] = "❌ Not reachable"
+        # Check both agents concurrently
+        responses = await asyncio.gather(
+            *(self.client.get(f"{url}/health", timeout=5) for url in agents.values()),
+            return_exceptions=True,
+        )
         
-        # Check car rental agent
-        try:
-            response = requests.get(f"{self.car_rental_agent_url}/health", timeout=5)
-            if response.status_code == 200:
-                agents_status["car_rental"] = "✅ Running"
+        agents_status = {}
+        for agent, response in zip(agents, responses):
+            if isinstance(response, Exception):
+                agents_status[agent] = "❌ Not reachable"
+            elif response.status_code == 200:
+                agents_status[agent] = "✅ Running"
             else:
-                agents_status["car_rental"] = "❌ Not responding"
-        except:
-            agents_status["car_rental"] = "❌ Not reachable"
+                agents_status[agent] = "❌ Not responding"
         
         return agents_status
     
-    def ask_hotel_agent(self, query):
+    async def ask_hotel_agent(self, query):
         """Ask the hotel booking agent for recommendations."""
         try:
             payload = {"message": query}
-            response = requests.post(
+            response = await self.client.post(
                 f"{self.hotel_agent_url}/chat",
                 json=payload,
                 headers={"Content-Type": "application/json"},
-                timeout=30
             )
             
             if response.status_code == 200:
@@ -75,15 +91,14 @@ class SimpleTravelPlanner:
         except Exception as e:
             return f"Error communicating with hotel agent: {e}"
     
-    def ask_car_rental_agent(self, query):
+    async def ask_car_rental_agent(self, query):
         """Ask the car rental agent for recommendations."""
         try:
             payload = {"message": query}
-            response = requests.post(
+            response = await self.client.post(
                 f"{self.car_rental_agent_url}/chat",
                 json=payload,
                 headers={"Content-Type": "application/json"},
-                timeout=30
             )
             
             if response.status_code == 200:
@@ -94,13 +109,13 @@ class SimpleTravelPlanner:
         except Exception as e:
             return f"Error communicating with car rental agent: {e}"
     
-    def plan_trip(self, query):
-        """Plan a complete trip by coordinating with other agents."""
+    async def _build_plan_prompt(self, query):
+        """Gather hotel and car rental options and build the travel plan prompt."""
         print(f"✈️ Planning trip: {query}")
         print("=" * 60)
         
         # Check agent status
-        status = self.check_agent_status()
+        status = await self.check_agent_status()
         print("📊 Agent Status:")
         for agent, status_text in status.items():
             print(f"  {agent}: {status_text}")
@@ -108,15 +123,14 @@ class SimpleTravelPlanner:
         # Extract destination from query (simple approach)
         destination = "Paris"  # Default, can be improved with LLM extraction
         
-        # Ask hotel agent for recommendations
-        print(f"\n🏨 Getting hotel recommendations for {destination}...")
+        # Ask hotel and car rental agents for recommendations concurrently
+        print(f"\n🏨🚗 Getting hotel recommendations and car rental options for {destination}...")
         hotel_query = f"Find top 10 budget-friendly hotels in {destination}"
-        hotel_response = self.ask_hotel_agent(hotel_query)
-        
-        # Ask car rental agent for recommendations
-        print(f"\n🚗 Getting car rental options for {destination}...")
         car_query = f"Find car rental options in {destination}"
-        car_response = self.ask_car_rental_agent(car_query)
+        hotel_response, car_response = await asyncio.gather(
+            self.ask_hotel_agent(hotel_query),
+            self.ask_car_rental_agent(car_query),
+        )
         
         # Create comprehensive travel plan
         print(f"\n📋 Creating comprehensive travel plan...")
@@ -142,18 +156,76 @@ class SimpleTravelPlanner:
         
         Format the response clearly with sections and bullet points.
         """
-        
+        return plan_prompt
+    
+    async def _invoke_plan(self, plan_prompt):
+        """Ask the LLM for a single travel plan."""
         try:
-            response = self.llm.invoke(plan_prompt)
+            response = await self.llm.ainvoke(plan_prompt)
             return response.content
         except Exception as e:
             return f"Error creating travel plan: {e}"
-
-def test_travel_planner():
-    """Test the simplified travel planner."""
-    print("🚀 Testing Simplified Travel Planner")
-    print("=" * 60)
     
+    async def plan_trip(self, query):
+        """Plan a complete trip by coordinating with other agents."""
+        return await self._invoke_plan(await self._build_plan_prompt(query))
+    
+    async def plan_trips(self, queries):
+        """Plan several trips, marshaling as many prompts per LLM call as fit in the context window."""
+        plan_prompts = await asyncio.gather(*(self._build_plan_prompt(query) for query in queries))
+        
+        groups = []
+        group_tokens = 0
+        for plan_prompt in plan_prompts:
+            prompt_tokens = _estimate_tokens(plan_prompt) + PLAN_OUTPUT_TOKENS
+            if groups and group_tokens + prompt_tokens <= CONTEXT_TOKENS:
+                groups[-1].append(plan_prompt)
+                group_tokens += prompt_tokens
+            else:
+                groups.append([plan_prompt])
+                group_tokens = prompt_tokens
+        
+        results = await asyncio.gather(*(self._plan_group(group) for group in groups))
+        return [plan for group_plans in results for plan in group_plans]
+    
+    async def _plan_group(self, plan_prompts):
+        """Plan a group of trips that fits in one LLM call."""
+        if len(plan_prompts) == 1:
+            return [await self._invoke_plan(plan_prompts[0])]
+        
+        batch_prompt = (
+            f"Answer each of the following {len(plan_prompts)} travel planning requests independently, in order. "
+            f"Separate consecutive answers with a line containing only {PLAN_DELIMITER} "
+            "and do not add any text before the first answer or after the last one.\n\n"
+            + "\n\n".join(
+                f"Request {i}:\n{plan_prompt}" for i, plan_prompt in enumerate(plan_prompts, 1)
+            )
+        )
+        
+        try:
+            response = await self.llm.ainvoke(batch_prompt)
+        except Exception as e:
+            return [f"Error creating travel plan: {e}"] * len(plan_prompts)
+        
+        plans = [plan.strip() for plan in response.content.split(PLAN_DELIMITER) if plan.strip()]
+        if len(plans) != len(plan_prompts):
+            # The model broke the delimiter contract, fall back to one call per request
+            return await asyncio.gather(*(self._invoke_plan(plan_prompt) for plan_prompt in plan_prompts))
+        return plans
+    
+    async def plan_trip_stream(self, query):
+        """Plan a complete trip, yielding the plan as the LLM streams it."""
+        plan_prompt = await self._build_plan_prompt(query)
+        
+        try:
+            async for chunk in self.llm.astream(plan_prompt):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            yield f"Error creating travel plan: {e}"
+
+async def _run_test_queries():
+    """Run the travel planner test queries on a single event loop."""
     try:
         planner = SimpleTravelPlanner()
         print("✅ Travel planner initialized successfully!")
@@ -170,7 +242,7 @@ def test_travel_planner():
             print("-" * 60)
             
             try:
-                plan = planner.plan_trip(query)
+                plan = await planner.plan_trip(query)
                 print(f"✅ Travel Plan:")
                 print(plan)
                 print("\n" + "="*60)
@@ -179,9 +251,17 @@ def test_travel_planner():
                 print(f"❌ Error: {str(e)}")
         
         print("\n🎉 Travel planner tests completed!")
+        await planner.aclose()
         
     except Exception as e:
         print(f"❌ Error initializing travel planner: {str(e)}")
 
+def test_travel_planner():
+    """Test the simplified travel planner."""
+    print("🚀 Testing Simplified Travel Planner")
+    print("=" * 60)
+    
+    asyncio.run(_run_test_queries())
+
 if __name__ == "__main__":
     test_travel_planner() 
\ No newline at end of file